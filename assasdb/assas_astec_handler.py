@@ -4,13 +4,16 @@ import zipfile
 import glob
 import logging
 import subprocess
+import multiprocessing
 import numpy
 import h5py
 
+from concurrent.futures import ProcessPoolExecutor
+
 from .assas_database_dataset import AssasDataset
 from .assas_database_hdf5 import AssasHdf5DatasetHandler
 
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 logger = logging.getLogger('assas_app')
 
@@ -40,27 +43,61 @@ class AssasAstecHandler:
         A = astec.Astec(AP) # make an instance of Astec
         A.set_environment() # initialize all environment variables
     
+    @staticmethod
+    def init_pyastec(
+    ) -> None:
+        
+        import pyastec as pa # pyastec can now be loadded
+        pa.astec_init()
+    
+    @staticmethod
+    def get_list_of_saving_times(
+        archive_path: str
+    ) -> List[str]:
+        
+        import pyastec as pa
+        
+        try:
+            return pa.tools.get_list_of_saving_time_from_path(archive_path)
+        except:
+            logger.error(f'Astec archive is not consistent {archive_path}')
+            return [-1]
+    
     def get_lists_of_saving_times(
         self,
         archive_path_list: List[str],
+        max_workers: Optional[int] = None
     ) -> List[List[str]]:
+        '''
+        Archives are parsed in parallel worker processes, each initializing pyastec once.
+        By default there is one worker per archive, at most one per cpu. A single archive
+        is parsed in this process. The workers are spawned, because the calling process runs
+        pymongo and watchdog threads and forking it can deadlock the workers. They inherit the
+        ASTEC environment and sys.path, and re-import the main module of the calling script,
+        which therefore needs a __main__ guard.
+        '''
+        
+        if len(archive_path_list) <= 1:
+            
+            AssasAstecHandler.init_pyastec()
+            
+            return [AssasAstecHandler.get_list_of_saving_times(archive_path) for archive_path in archive_path_list]
         
-        result_list = []
-
-        import pyastec as pa # pyastec can now be loadded
-        pa.astec_init()
+        if max_workers is None:
+            max_workers = min(len(archive_path_list), os.cpu_count() or 1)
         
-        for archive_path in archive_path_list:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=AssasAstecHandler.init_pyastec
+        ) as executor:
             
-            try:
-                saved_instants = pa.tools.get_list_of_saving_time_from_path(archive_path)
-                result_list.append(saved_instants)
-            except:
-                logger.error(f'Astec archive is not consistent {archive_path}')
-                result_list.append([-1])
+            result_list = list(executor.map(
+                AssasAstecHandler.get_list_of_saving_times,
+                archive_path_list,
+                chunksize=1
+            ))
        
-        #pa.end()       
-        
         return result_list
     
     @staticmethod
@@ -73,6 +110,16 @@ class AssasAstecHandler:
         
         return size_in_giga_bytes
     
+    @staticmethod
+    def get_sizes_of_archives_in_giga_bytes(
+        numbers_of_timesteps: List[int],
+        size_of_saving: float = 1.68
+    ) -> numpy.ndarray:
+        
+        sizes_in_giga_bytes = (numpy.asarray(numbers_of_timesteps, dtype=numpy.float64) * size_of_saving) / 1000.0
+        
+        return sizes_in_giga_bytes
+    
     def read_astec_archives(
         self,
         archive_path_list: List[str],
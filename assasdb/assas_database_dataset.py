@@ -18,9 +18,10 @@ class AssasDataset:
         self.channels = 4
         self.meshes = 16
         self.samples = samples
+        self.values = np.zeros((len(self.variables), self.channels, self.meshes, samples))
         self.data = {}        
-        for variable in self.variables:
-            self.data[variable] = np.zeros((self.channels, self.meshes, samples))
+        for index, variable in enumerate(self.variables):
+            self.data[variable] = self.values[index]
     
     def get_data(
         self
@@ -28,6 +29,16 @@ class AssasDataset:
         
         return self.data
     
+    def get_all_data(
+        self
+    )-> np.ndarray:
+        '''
+        All variables as one contiguous array of shape (variables, channels, meshes, samples).
+        The arrays returned by get_data_for_variable are views into this array.
+        '''
+        
+        return self.values
+    
     def get_data_for_variable(
         self,
         variable: str
@@ -1,12 +1,86 @@
 import logging
+import functools
+import atexit
+import threading
  
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument, WriteConcern, UpdateOne
+from pymongo.errors import OperationFailure, PyMongoError
 from bson.objectid import ObjectId
-from uuid import uuid4
-from datetime import datetime
+from uuid import UUID, uuid4
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger('assas_app')
 
+_CLIENT_CACHE: Dict[str, MongoClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+# (connection string, database, collection) whose indexes were created by this process
+_INDEXED_COLLECTIONS: Set[Tuple[str, str, str]] = set()
+# write counter per connection string, shared by all handlers of the same client
+_VERSIONS: Dict[str, int] = {}
+
+def _get_client(
+    connection_string: str
+)-> MongoClient:
+    '''
+    MongoClient is thread-safe and pools its connections, so one client per
+    connection string is shared by all handlers of the process. Constructing
+    AssasDatabaseHandler (and AssasDatabaseManager) repeatedly is therefore cheap.
+    '''
+    
+    with _CLIENT_CACHE_LOCK:
+        
+        client = _CLIENT_CACHE.get(connection_string)
+        
+        if client is None:
+            client = MongoClient(connection_string, maxPoolSize=50)
+            _CLIENT_CACHE[connection_string] = client
+    
+    return client
+
+@atexit.register
+def _close_clients()-> None:
+    
+    with _CLIENT_CACHE_LOCK:
+        
+        for client in _CLIENT_CACHE.values():
+            client.close()
+        
+        _CLIENT_CACHE.clear()
+
+@functools.lru_cache(maxsize=4096)
+def _get_object_id(
+    id: str
+)-> ObjectId:
+    
+    return ObjectId(id)
+
+def _as_uuid_str(
+    uuid: Union[str, UUID]
+)-> str:
+    
+    return uuid if isinstance(uuid, str) else str(uuid)
+
+def _increases_version(
+    method
+):
+    '''
+    Increases the version after the write, also after a failed (possibly partial) one.
+    A reader which loads between the start of the write and its end caches the result
+    under the previous version, so it is loaded again afterwards.
+    '''
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.increase_version()
+    
+    return wrapper
+
 class AssasDatabaseHandler:
 
     def __init__(
@@ -14,10 +88,15 @@ class AssasDatabaseHandler:
         config: dict
     )-> None:
         
-        self.client = MongoClient(config.CONNECTIONSTRING)
+        self.connection_string = config.CONNECTIONSTRING
+        self.client = _get_client(self.connection_string)
 
         self.db_handle = self.client['assas']
         self.file_collection = self.db_handle['files']
+        # acknowledged by the primary without waiting for the journal, used for bulk ingestion
+        self.bulk_file_collection = self.db_handle.get_collection('files', write_concern=WriteConcern(w=1, j=False))
+        
+        self.ensure_file_indexes()
 
     def get_db_handle(
         self
@@ -31,40 +110,146 @@ class AssasDatabaseHandler:
         
         return self.file_collection
     
+    def ensure_file_indexes(
+        self
+    )-> None:
+        '''
+        Creates the indexes once per process and collection. Indexes which are rejected are
+        not retried on every construction (see create_file_indexes). Connection errors are
+        raised and the indexes are tried again by the next handler.
+        '''
+        
+        key = (self.connection_string, self.db_handle.name, self.file_collection.name)
+        
+        with _CLIENT_CACHE_LOCK:
+            
+            if key in _INDEXED_COLLECTIONS:
+                return
+            
+            _INDEXED_COLLECTIONS.add(key)
+        
+        try:
+            self.create_file_indexes()
+        except PyMongoError:
+            with _CLIENT_CACHE_LOCK:
+                _INDEXED_COLLECTIONS.discard(key)
+            raise
+    
+    def create_file_indexes(
+        self
+    )-> None:
+        '''
+        Indexes for the fields used as query filters. create_index is a no-op
+        for indexes which already exist. An index rejected by the server, e.g. a unique
+        index over duplicate values, is logged and skipped without affecting the others.
+        '''
+        
+        indexes = [
+            ('system_uuid', {'unique': True}),
+            ('system_upload_uuid', {}),
+            ('system_path', {'unique': True}),
+            ('system_status', {}),
+            ([('system_date', -1)], {}),
+        ]
+        
+        for keys, options in indexes:
+            try:
+                self.file_collection.create_index(keys, **options)
+            except OperationFailure as exception:
+                logger.error('Error when creating index %s of %s occured: %s', keys, self.file_collection.name, exception)
+    
+    def get_version(
+        self
+    )-> int:
+        '''
+        Counter which is increased on every write through any handler of this process
+        which shares the client. Used to invalidate results cached by the caller.
+        '''
+        
+        return _VERSIONS.get(self.connection_string, 0)
+    
+    def increase_version(
+        self
+    )-> None:
+        
+        with _CLIENT_CACHE_LOCK:
+            _VERSIONS[self.connection_string] = _VERSIONS.get(self.connection_string, 0) + 1
+    
+    @_increases_version
     def insert_file_document(
         self,
         file: dict
     ):
         
-        logger.info(f'Insert {file}')        
+        logger.info('Insert %s', file)
         self.file_collection.insert_one(file)
         
+    @_increases_version
+    def insert_file_documents(
+        self,
+        files: List[dict]
+    ):
+        
+        logger.info('Insert %s documents', len(files))
+        return self.bulk_file_collection.insert_many(files, ordered=False)
+        
+    @_increases_version
     def drop_file_collection(
         self
     ):
 
         self.file_collection.drop()
+        self.create_file_indexes()
         
     def get_file_document(
         self,
         id: str
     ):
         
-        return self.file_collection.find_one(ObjectId(id))
+        return self.file_collection.find_one({'_id': _get_object_id(id)})
     
     def get_file_document_by_uuid(
         self,
-        uuid: uuid4
+        uuid: Union[str, UUID]
     ):
         
-        return self.file_collection.find_one({'system_uuid':str(uuid)})
+        return self.file_collection.find_one({'system_uuid':_as_uuid_str(uuid)})
     
     def get_file_document_by_upload_uuid(
         self,
-        upload_uuid: uuid4
+        upload_uuid: Union[str, UUID]
     ):
         
-        return self.file_collection.find_one({'system_upload_uuid':str(upload_uuid)})
+        return self.file_collection.find_one({'system_upload_uuid':_as_uuid_str(upload_uuid)})
+    
+    def get_file_documents_by_upload_uuids(
+        self,
+        upload_uuid_list: List[Union[str, UUID]]
+    )-> Dict[str, dict]:
+        '''
+        First document per upload uuid, like get_file_document_by_upload_uuid, in one query.
+        Only one document per upload is transferred. Upload uuids without a document are missing in the result.
+        '''
+        
+        pipeline = [
+            {'$match': {'system_upload_uuid': {'$in': [_as_uuid_str(upload_uuid) for upload_uuid in upload_uuid_list]}}},
+            {'$sort': {'_id': 1}},
+            {'$group': {'_id': '$system_upload_uuid', 'document': {'$first': '$$ROOT'}}},
+        ]
+        
+        return {result['_id']: result['document'] for result in self.file_collection.aggregate(pipeline)}
+    
+    def get_known_upload_uuids(
+        self,
+        upload_uuid_list: List[Union[str, UUID]]
+    )-> Set[str]:
+        '''
+        Subset of upload_uuid_list which is already present in the collection, in one query.
+        '''
+        
+        query = {'system_upload_uuid': {'$in': [_as_uuid_str(upload_uuid) for upload_uuid in upload_uuid_list]}}
+        
+        return set(self.file_collection.distinct('system_upload_uuid', query))
     
     def get_file_document_by_path(
         self,
@@ -75,20 +260,43 @@ class AssasDatabaseHandler:
     
     def get_file_documents_by_status(
         self,
-        status: str
+        status: str,
+        batch_size: int = 500
     ):
         
-        return self.file_collection.find({'system_status':status})
+        return self.file_collection.find({'system_status':status}).batch_size(batch_size)
     
+    @_increases_version
     def update_file_document_by_uuid(
         self,
-        uuid: uuid4,
+        uuid: Union[str, UUID],
         update: dict
     ):
         
         post = {"$set": update}
-        return self.file_collection.update_one({'system_uuid':str(uuid)}, post)
+        return self.file_collection.update_one({'system_uuid':_as_uuid_str(uuid)}, post)
     
+    @_increases_version
+    def set_status_by_uuid(
+        self,
+        uuid: Union[str, UUID],
+        status: str
+    ):
+        '''
+        Atomic status change in a single round trip, returns the updated document.
+        '''
+        
+        post = {
+            '$set': {'system_status': status},
+            '$currentDate': {'system_last_modified': True}
+        }
+        return self.file_collection.find_one_and_update(
+            {'system_uuid':_as_uuid_str(uuid)},
+            post,
+            return_document=ReturnDocument.AFTER
+        )
+    
+    @_increases_version
     def update_file_document_by_path(
         self,
         path: str,
@@ -98,35 +306,67 @@ class AssasDatabaseHandler:
         post = {"$set": update}
         return self.file_collection.update_one({'system_path':path}, post)
     
+    @_increases_version
+    def update_file_documents_by_path(
+        self,
+        updates: Dict[str, dict]
+    ):
+        '''
+        Apply several updates, keyed by system_path, in one bulk write.
+        '''
+        
+        if len(updates) == 0:
+            return None
+        
+        requests = [UpdateOne({'system_path':path}, {"$set": update}) for path, update in updates.items()]
+        return self.file_collection.bulk_write(requests, ordered=False)
+    
+    @_increases_version
     def update_file_document_by_upload_uuid(
         self,
-        upload_uuid: uuid4,
+        upload_uuid: Union[str, UUID],
         update: dict
     ):
         
         post = {"$set": update}
-        return self.file_collection.update_one({'system_upload_uuid':str(upload_uuid)}, post)
+        return self.file_collection.update_one({'system_upload_uuid':_as_uuid_str(upload_uuid)}, post)
     
+    @_increases_version
     def delete_file_document(
         self,
         id: str
     ):
         
-        return self.file_collection.delete_one({'_id': ObjectId(id)})
+        return self.file_collection.delete_one({'_id': _get_object_id(id)})
     
+    @_increases_version
     def delete_file_document_by_uuid(
         self,
-        uuid: uuid4
+        uuid: Union[str, UUID]
     ):
         
-        return self.file_collection.delete_one({'system_uuid':str(uuid)})
+        return self.file_collection.delete_one({'system_uuid':_as_uuid_str(uuid)})
     
+    @_increases_version
     def delete_file_document_by_upload_uuid(
         self,
-        upload_uuid: uuid4
+        upload_uuid: Union[str, UUID]
     ):
         
-        return self.file_collection.delete_one({'system_upload_uuid':str(upload_uuid)})
+        return self.file_collection.delete_one({'system_upload_uuid':_as_uuid_str(upload_uuid)})
+
+_TEST_DOCUMENT_TEMPLATE = MappingProxyType({
+    "system_size": "8.4 MB",
+    "system_user": "test user",
+    "system_download": "Download",
+    "system_status": "complete",
+    "meta_name": "Name of Simulation X",
+    "meta_description": "'this is a test description!'",
+    "meta_data_variables": "['pressure', 'voidf', 'temp', 'sat_temp']",
+    "meta_data_channels": "4",
+    "meta_data_meshes": "16",
+    "meta_data_samples": "1000"
+})
 
 class AssasDocumentFileStatus:
     UPLOADED = 'Uploaded'
@@ -140,10 +380,10 @@ class AssasDocumentFile:
     
     def __init__(
         self,
-        document: dict = {}
+        document: Optional[dict] = None
     ) -> None:
         
-        self.document = document
+        self.document = {} if document is None else document
                 
     def get_document(
         self
@@ -163,10 +403,7 @@ class AssasDocumentFile:
         add_document: dict
     ) -> None:
         
-        temp = self.document.copy()
-        temp.update(add_document)
-        
-        self.document = temp
+        self.document.update(add_document)
         
     def set_general_meta_values(
         self,
@@ -221,7 +458,7 @@ class AssasDocumentFile:
         self,
         system_uuid: str,
         system_upload_uuid: str,
-        system_date: str,
+        system_date: datetime,
         system_path: str,
         system_result: str,
         system_size: str,
@@ -242,28 +479,24 @@ class AssasDocumentFile:
 
     @staticmethod
     def get_test_document_file(
-        system_uuid: uuid4 =str(uuid4()),
-        system_upload_uuid: uuid4 = str(uuid4()),
+        system_uuid: Optional[str] = None,
+        system_upload_uuid: Optional[str] = None,
         system_path: str = 'default_path',
         system_result: str = 'default_path'
     ) -> dict:
- 
-        document = {
-                    "system_uuid": system_uuid,
-                    "system_upload_uuid": system_upload_uuid,
-                    "system_date": datetime.now().strftime("%m/%d/%Y, %H:%M:%S"),
-                    "system_path": system_path,
-                    "system_result": system_result,
-                    "system_size": "8.4 MB",
-                    "system_user": "test user",
-                    "system_download": "Download",
-                    "system_status": "complete",
-                    "meta_name": "Name of Simulation X",
-                    "meta_description": "'this is a test description!'",
-                    "meta_data_variables": "['pressure', 'voidf', 'temp', 'sat_temp']",
-                    "meta_data_channels": "4",
-                    "meta_data_meshes": "16",
-                    "meta_data_samples": "1000"
-                }
-        
-        return document 
\ No newline at end of file
+        
+        if system_uuid is None:
+            system_uuid = str(uuid4())
+            
+        if system_upload_uuid is None:
+            system_upload_uuid = str(uuid4())
+        
+        return {
+            **_TEST_DOCUMENT_TEMPLATE,
+            'system_uuid': system_uuid,
+            'system_upload_uuid': system_upload_uuid,
+            # naive UTC without sub-second part, to compare equal after a BSON round trip
+            'system_date': datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0),
+            'system_path': system_path,
+            'system_result': system_result
+        }
\ No newline at end of file
@@ -1,4 +1,5 @@
 import h5py
+import json
 import logging
 import os 
 import numpy as np
@@ -30,14 +31,26 @@ class AssasHdf5DatasetHandler:
         with h5py.File(file_path, 'a') as h5file:
             
             data_group = h5file.require_group('data')
+            array = np.ascontiguousarray(dataset.get_all_data())
+            
+            variables, channels, meshes, samples = np.shape(array)
+            
+            if array.size == 0:
+                # h5py rejects chunks larger than an empty shape, an empty dataset needs neither chunks nor filters
+                logger.info(f'Create empty dataset for variables {dataset.get_variables()} with shape {np.shape(array)}')
+                data_group.create_dataset('values', data=array)
+            else:
+                chunks = (1, 1, meshes, min(samples, 256))
                 
-            for variable in dataset.get_variables():
-                
-                group = data_group.require_group(variable)
-                array = dataset.get_data_for_variable(variable)
-                
-                logger.info(f'Create dataset for variable {variable}')
-                group.create_dataset(variable, data=array)
+                logger.info(f'Create dataset for variables {dataset.get_variables()} with chunks {chunks}')
+                data_group.create_dataset(
+                    'values',
+                    data=array,
+                    chunks=chunks,
+                    compression='lzf',
+                    shuffle=True
+                )
+            data_group.attrs['variables'] = dataset.get_variables()
 
     @staticmethod
     def get_variable_data_from_hdf5(
@@ -49,11 +62,18 @@ class AssasHdf5DatasetHandler:
         
         with h5py.File(file_path, 'r') as h5file:            
             try:
-                array = h5file['data'][variable][variable][:]
+                data_group = h5file['data']
+                
+                if 'values' in data_group:
+                    variables = list(data_group.attrs['variables'])
+                    array = data_group['values'][variables.index(variable)]
+                else:
+                    array = data_group[variable][variable][:]
+
                 logger.info(f'Shape of dataset {np.shape(array)}')
                 
                 return array
-            except:
+            except (KeyError, ValueError):
                 logger.error(f'Wrong variable name {variable}')
 
     @staticmethod
@@ -65,21 +85,22 @@ class AssasHdf5DatasetHandler:
         logger.info(f'Write meta data into {hdf5_path}')
         
         result_dir = os.path.dirname(hdf5_path)
-        if not os.path.isdir(result_dir):
-            os.makedirs(result_dir)
+        os.makedirs(result_dir, exist_ok=True)
+        
+        meta_data = {
+            'uuid': document.get_value('system_uuid'),
+            'name': document.get_value('meta_name'),
+            'description': document.get_value('meta_description'),
+            'variables': document.get_value('meta_data_variables'),
+            'channels': document.get_value('meta_data_channels'),
+            'meshes': document.get_value('meta_data_meshes'),
+            'samples': document.get_value('meta_data_samples'),
+        }
         
         with h5py.File(hdf5_path, 'w') as h5file:
             
             h5file.create_group('meta_data')
-            
-            h5file['meta_data'].attrs['uuid'] = document.get_value('system_uuid')
-            h5file['meta_data'].attrs['name'] = document.get_value('meta_name')
-            h5file['meta_data'].attrs['description'] = document.get_value('meta_description')
-            
-            h5file['meta_data'].attrs['variables'] = document.get_value('meta_data_variables')
-            h5file['meta_data'].attrs['channels'] = document.get_value('meta_data_channels')
-            h5file['meta_data'].attrs['meshes'] = document.get_value('meta_data_meshes')
-            h5file['meta_data'].attrs['samples'] = document.get_value('meta_data_samples')
+            h5file['meta_data'].attrs['meta_json'] = json.dumps(meta_data)
         
     @staticmethod
     def read_meta_data_from_hdf5(
@@ -91,13 +112,20 @@ class AssasHdf5DatasetHandler:
         
         with h5py.File(hdf5_path, 'r') as h5file:
             
-            document.set_value('meta_name', h5file['meta_data'].attrs['name'])
-            document.set_value('meta_description', h5file['meta_data'].attrs['description'])
+            attributes = h5file['meta_data'].attrs
             
-            document.set_value('meta_data_variables', h5file['meta_data'].attrs['variables'])
-            document.set_value('meta_data_channels', str(h5file['meta_data'].attrs['channels']))
-            document.set_value('meta_data_meshes', str(h5file['meta_data'].attrs['meshes']))
-            document.set_value('meta_data_samples', str(h5file['meta_data'].attrs['samples']))
+            if 'meta_json' in attributes:
+                meta_data = json.loads(attributes['meta_json'])
+            else:
+                meta_data = dict(attributes)
+            
+        document.set_value('meta_name', meta_data['name'])
+        document.set_value('meta_description', meta_data['description'])
+        
+        document.set_value('meta_data_variables', meta_data['variables'])
+        document.set_value('meta_data_channels', str(meta_data['channels']))
+        document.set_value('meta_data_meshes', str(meta_data['meshes']))
+        document.set_value('meta_data_samples', str(meta_data['samples']))
             
         return document
         
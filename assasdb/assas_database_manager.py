@@ -1,17 +1,22 @@
-import pandas
 import logging
 import numpy
 import os
 import shutil
+import stat
 import uuid
 import pathlib
 import pickle
-import threading
-import subprocess
+import json
+import tempfile
+import time
+import functools
+import math
+import concurrent.futures
 
 from uuid import uuid4
-from datetime import datetime
-from typing import List, Tuple, Union
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from pymongo.errors import PyMongoError
 
 from .assas_database_handler import AssasDatabaseHandler
 from .assas_astec_handler import AssasAstecHandler
@@ -19,15 +24,97 @@ from .assas_database_hdf5 import AssasHdf5DatasetHandler
 from .assas_database_dataset import AssasDataset
 from .assas_database_handler import AssasDocumentFile, AssasDocumentFileStatus
 
+if TYPE_CHECKING:
+    import pandas
+
 logger = logging.getLogger('assas_app')
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+@functools.lru_cache(maxsize=256)
+def _load_upload_info(
+    upload_info_file: str,
+    inode: int,
+    size: int,
+    mtime_ns: int
+)-> dict:
+    '''
+    Cached by path, inode, size and modification time. A file replaced by os.replace gets
+    a new inode, so a rewrite is loaded again even if the modification time of a network
+    share did not change. The returned dictionary is shared and must not be modified.
+    '''
+    
+    with open(upload_info_file, 'r') as file:
+        return json.load(file)
+
+def _get_upload_info(
+    upload_info_file: str
+)-> dict:
+    
+    file_info = os.stat(upload_info_file)
+    
+    return _load_upload_info(upload_info_file, file_info.st_ino, file_info.st_size, file_info.st_mtime_ns)
+
+def _to_json_value(
+    value: object
+)-> str:
+    '''
+    Values of an upload_info.pickle which JSON can not represent natively.
+    Anything else is rejected instead of being written half.
+    '''
+    
+    if isinstance(value, datetime):
+        return value.isoformat()
+    
+    if isinstance(value, (uuid.UUID, pathlib.PurePath)):
+        return str(value)
+    
+    raise ValueError(f'Upload information value {value!r} of type {type(value).__name__} is not JSON serializable')
+
+def _get_file_mode(
+    reference_file: str
+)-> int:
+    '''
+    Permission bits of reference_file, or those open() would give a new file if it does not exist.
+    '''
+    
+    try:
+        return stat.S_IMODE(os.stat(reference_file).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+def _write_upload_info(
+    upload_info_file: str,
+    upload_info: dict,
+    reference_file: Optional[str] = None
+)-> None:
+    '''
+    Written to a temporary file which replaces upload_info_file, so readers never see a partial file.
+    mkstemp creates the file readable only by its owner. Because the upload directory is shared
+    between users, it gets the permissions of the file it replaces (or of reference_file) first.
+    '''
+    
+    mode = _get_file_mode(upload_info_file if reference_file is None else reference_file)
+    file_descriptor, temp_file = tempfile.mkstemp(dir=os.path.dirname(upload_info_file), suffix='.tmp')
+    
+    try:
+        os.fchmod(file_descriptor, mode)
+        with os.fdopen(file_descriptor, 'w') as file:
+            json.dump(upload_info, file, default=_to_json_value)
+        os.replace(temp_file, upload_info_file)
+    except BaseException:
+        os.unlink(temp_file)
+        raise
+
 class AssasAstecArchive:
     
     def __init__(
         self,
         upload_uuid: uuid4,
         name: str,
-        date: str,
+        date: datetime,
         user: str,
         description: str,
         archive_path: str,
@@ -72,6 +159,26 @@ class AssasAstecArchive:
 
 
 class AssasDatabaseManager:
+    
+    data_frame_cache_ttl = 30.0
+    
+    date_format = '%m/%d/%Y, %H:%M:%S'
+    
+    database_entry_fields = (
+        '_id',
+        'system_uuid',
+        'system_upload_uuid',
+        'system_date',
+        'system_path',
+        'system_result',
+        'system_size',
+        'system_size_hdf5',
+        'system_user',
+        'system_download',
+        'system_status',
+        'meta_name',
+        'meta_description',
+    )
 
     def __init__(
         self,
@@ -81,6 +188,8 @@ class AssasDatabaseManager:
         self.config = config
         self.database_handler = AssasDatabaseHandler(config)
         self.astec_handler = AssasAstecHandler(config)
+        
+        self._data_frame_cache = None
     
     def get_database_entry_by_upload_uuid(
         self,
@@ -112,19 +221,66 @@ class AssasDatabaseManager:
     
     def get_all_database_entries(
         self
-    ) -> pandas.DataFrame:
+    ) -> 'pandas.DataFrame':
+        '''
+        The data frame is cached until a write goes through the database handler
+        or data_frame_cache_ttl seconds have passed (writes of other processes).
+        '''
+        
+        version = self.database_handler.get_version()
+        now = time.monotonic()
+        
+        if self._data_frame_cache is not None:
+            
+            cached_version, cached_time, cached_data_frame = self._data_frame_cache
+            
+            if cached_version == version and now - cached_time < self.data_frame_cache_ttl:
+                return cached_data_frame.copy()
+        
+        data_frame = self._load_all_database_entries()
+        self._data_frame_cache = (version, now, data_frame)
+        
+        return data_frame.copy()
+    
+    def _load_all_database_entries(
+        self
+    ) -> 'pandas.DataFrame':
+        
+        # pandas is only needed here, importing it lazily keeps importing assasdb cheap
+        import pandas
         
         file_collection = self.database_handler.get_file_collection()
         
-        data_frame = pandas.DataFrame(list(file_collection.find()))
+        projection = {field: 1 for field in self.database_entry_fields}
+        
+        pipeline = [
+            {'$project': projection},
+            {'$setWindowFields': {
+                'sortBy': {'_id': 1},
+                'output': {'system_index': {'$documentNumber': {}}}
+            }},
+            {'$addFields': {
+                '_id': {'$toString': '$_id'},
+                'system_date': {'$cond': [
+                    {'$eq': [{'$type': '$system_date'}, 'date']},
+                    {'$dateToString': {'date': '$system_date', 'format': self.date_format}},
+                    '$system_date'
+                ]}
+            }},
+        ]
         
-        logger.info(f'Load data frame with size {str(data_frame.size), str(data_frame.shape)}')
+        cursor = file_collection.aggregate(pipeline, allowDiskUse=True, batchSize=2000)
         
-        if data_frame.size == 0:
-            return data_frame
+        columns = {field: [] for field in self.database_entry_fields + ('system_index',)}
+        column_appends = [(field, column.append) for field, column in columns.items()]
         
-        data_frame['system_index'] = range(1, len(data_frame) + 1)    
-        data_frame['_id'] = data_frame['_id'].astype(str)
+        for document in cursor:
+            for field, append in column_appends:
+                append(document.get(field))
+        
+        data_frame = pandas.DataFrame(columns)
+        
+        logger.info('Load data frame with size %s, shape %s', data_frame.size, data_frame.shape)
 
         return data_frame
     
@@ -134,24 +290,33 @@ class AssasDatabaseManager:
         status: AssasDocumentFileStatus
     )-> None:
         
-        update = {f'system_status': f'{str(status)}'}
-        logger.info(f'Update file document with uuid {uuid} with update string {update}')
+        document = self.database_handler.set_status_by_uuid(uuid, str(status))
         
-        document = self.database_handler.get_file_document_by_uuid(uuid)
-        system_uuid = document['system_uuid']
-        logger.info(f'Found document with uuid {system_uuid}')
-                
-        self.database_handler.update_file_document_by_uuid(uuid, update)
-        logger.info(f'Update file document with uuid {uuid} and set status to {status}')
+        if document is None:
+            logger.error('Found no file document with uuid %s', uuid)
+            return
+        
+        logger.info('Update file document with uuid %s and set status to %s', uuid, status)
     
     def add_internal_database_entry(
         self, 
         document: dict
     ) -> None:
         
-        logger.info(f'Insert document {document}')        
+        logger.info('Insert document %s', document)
         self.database_handler.insert_file_document(document)
         
+    def add_internal_database_entries(
+        self,
+        document_list: List[dict]
+    ) -> None:
+        
+        if len(document_list) == 0:
+            return
+        
+        logger.info('Insert %s documents', len(document_list))
+        self.database_handler.insert_file_documents(document_list)
+        
     def empty_internal_database(
         self
     )-> None:
@@ -167,54 +332,110 @@ class AssasDatabaseManager:
         This function will convert kilobytes to MB, GB, and TB.
         """
         
-        logger.info(f'Num {num}')
+        index = min(int(math.log(max(num, 1), blocksize)), len(_SIZE_UNITS) - 1)
         
-        for x in ['B', 'KB', 'MB', 'GB', 'TB']:
-            
-            if num < blocksize:
-                
-                converted_string = f'{round(num, 2)} {x}'
-                logger.info(f'Converted into {converted_string}')
-                return converted_string
-            
-            num /= blocksize
+        # correct a logarithm which is rounded below an exact power of blocksize
+        if index < len(_SIZE_UNITS) - 1 and num >= blocksize ** (index + 1):
+            index += 1
+        
+        converted_num = num
+        if index > 0:
+            converted_num /= blocksize ** index
+        
+        converted_string = f'{round(converted_num, 2)} {_SIZE_UNITS[index]}'
+        logger.debug('Converted %s into %s', num, converted_string)
+        
+        return converted_string
     
     @staticmethod
     def get_size_of_directory_in_bytes(
         directory: str
     )-> float:
-        logger.info(f'Get size of {directory}')
-        return float(subprocess.check_output(['du', '-sb', directory]).split()[0])
+        '''
+        Apparent size of all files below directory (like du -sb), without symlinks being followed.
+        '''
+        
+        logger.info('Get size of %s', directory)
+        
+        if not os.path.isdir(directory):
+            return float(os.lstat(directory).st_size)
+        
+        size_in_bytes = 0
+        directory_stack = [directory]
+        
+        while directory_stack:
+            
+            with os.scandir(directory_stack.pop()) as entries:
+                
+                for entry in entries:
+                    
+                    if entry.is_dir(follow_symlinks=False):
+                        directory_stack.append(entry.path)
+                    else:
+                        size_in_bytes += entry.stat(follow_symlinks=False).st_size
+        
+        return float(size_in_bytes)
     
     def update_archive_sizes(
-        self
+        self,
+        max_workers: int = 8
     )-> bool:
         
         success = False
         
-        documents = self.database_handler.get_file_documents_by_status(AssasDocumentFileStatus.UPLOADED)
-        document_file_list = [AssasDocumentFile(document) for document in documents]
+        try:
+            
+            documents = list(self.database_handler.get_file_documents_by_status(AssasDocumentFileStatus.UPLOADED))
         
-        if len(document_file_list) == 0:
+        except PyMongoError as exception:
             
-            logger.info(f'No archives in state UPLOADED present')
+            logger.error('Error when reading archives in state UPLOADED occured: %s', exception)
+            return success
+        
+        updates = {}
+        failures = 0
         
-        try:       
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             
-            for document_file in document_file_list:
+            future_to_document_file = {}
             
-                archive_size = AssasDatabaseManager.get_size_of_directory_in_bytes(document_file.get_value('system_path'))
-                converted_size = AssasDatabaseManager.convert_from_bytes(archive_size)
+            for document in documents:
+                
+                if 'system_path' not in document:
+                    failures += 1
+                    logger.error('Archive document %s has no system_path', document.get('_id'))
+                    continue
+                
+                future = executor.submit(AssasDatabaseManager.get_size_of_directory_in_bytes, document['system_path'])
+                future_to_document_file[future] = AssasDocumentFile(document)
             
-                document_file.set_value('system_size', converted_size)
-                document_file.set_value('system_status', AssasDocumentFileStatus.VALIDATED)
-                self.database_handler.update_file_document_by_path(document_file.get_value('system_path'), document_file.get_document())
+            for future in concurrent.futures.as_completed(future_to_document_file):
                 
-            success = True
+                document_file = future_to_document_file[future]
+                archive_path = document_file.get_value('system_path')
+                
+                try:
+                    archive_size = future.result()
+                except OSError as exception:
+                    failures += 1
+                    logger.error('Error during update of archive size of %s occured: %s', archive_path, exception)
+                    continue
+                
+                document_file.set_value('system_size', AssasDatabaseManager.convert_from_bytes(archive_size))
+                document_file.set_value('system_status', AssasDocumentFileStatus.VALIDATED)
+                updates[archive_path] = document_file.get_document()
         
-        except Exception as exception:
+        if len(documents) == 0:
+            logger.info('No archives in state UPLOADED present')
+        
+        try:
+            
+            self.database_handler.update_file_documents_by_path(updates)
+            success = failures == 0
+        
+        except PyMongoError as exception:
             
-            logger.error(f'Error during update of archive sizes occured: {exception}')
+            logger.error('Error during update of archive sizes occured: %s', exception)
             
         return success
             
@@ -232,7 +453,7 @@ class AssasDatabaseManager:
         except ValueError:
             logger.error('Received univalid uuid')
         
-        logger.info(f'Read Upload uuids {upload_uuid_list}')
+        logger.info('Read Upload uuids %s', upload_uuid_list)
         
         return upload_uuid_list
     
@@ -243,16 +464,16 @@ class AssasDatabaseManager:
         
         upload_uuid_list = []
         
-        for directory in os.listdir(upload_directory):
-            if os.path.isdir(os.path.join(upload_directory, directory)):
-                if os.path.isfile(os.path.join(upload_directory, directory, directory)):
-                    logger.debug(f'Detected complete uploaded archive {os.path.join(upload_directory, directory)}')
+        with os.scandir(upload_directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(entry.path, entry.name)):
+                    logger.debug('Detected complete uploaded archive %s', entry.path)
                     try:
-                        upload_uuid_list.append(uuid.UUID(directory))        
+                        upload_uuid_list.append(uuid.UUID(entry.name))        
                     except ValueError:
                         logger.error('Received univalid uuid')
         
-        logger.debug(f'Read {len(upload_uuid_list)} upload uuids {upload_uuid_list} in {upload_directory}')
+        logger.debug('Read %s upload uuids %s in %s', len(upload_uuid_list), upload_uuid_list, upload_directory)
       
         return upload_uuid_list
     
@@ -263,67 +484,132 @@ class AssasDatabaseManager:
         """
         this function will return the file size
         """
-        if os.path.isfile(file_path):
-            
+        try:
             file_info = os.stat(file_path)
-            logger.info(f'File size: {file_info.st_size} Os.path.getsize: {os.path.getsize(file_path)}')
+        except FileNotFoundError:
+            return None
+        
+        if stat.S_ISREG(file_info.st_mode):
+            
+            logger.info('File size: %s', file_info.st_size)
             
             converted_in_bytes = AssasDatabaseManager.convert_from_bytes(file_info.st_size)
-            logger.info(f'Converted in bytes {converted_in_bytes}')
+            logger.info('Converted in bytes %s', converted_in_bytes)
             
             return converted_in_bytes
         
-        if os.path.isdir(file_path):
+        if stat.S_ISDIR(file_info.st_mode):
             
             raise NotImplementedError(f'Path {file_path} points to a directory')
     
-    def get_uploaded_archives_to_process(
+    def get_new_upload_uuids(
         self
-    )-> List[AssasAstecArchive]:
-
-        registered_archive_list = []
+    )-> List[uuid4]:
+        
+        new_upload_uuid_list = []
         upload_uuid_list = AssasDatabaseManager.get_upload_uuids2(self.config.UPLOAD_DIRECTORY)
         #upload_uuid_list = AssasDatabaseManager.get_upload_uuids(self.config.UPLOAD_FILE)
         
-        for upload_uuid in upload_uuid_list:
+        known_upload_uuids = self.database_handler.get_known_upload_uuids(upload_uuid_list)
         
-                documents = self.database_handler.get_file_document_by_upload_uuid(upload_uuid)
+        for upload_uuid in upload_uuid_list:
                                     
-                if documents is None:
+                if str(upload_uuid) not in known_upload_uuids:
                 
-                    logger.info(f'Detect new upload with upload_uuid {str(upload_uuid)}')
-                    
-                    archive_list = self.read_upload_info(upload_uuid)                    
-                    registered_archive_list.extend(archive_list)
+                    logger.info('Detect new upload with upload_uuid %s', upload_uuid)
+                    new_upload_uuid_list.append(upload_uuid)
             
                 else:
                 
-                    logger.info(f'Upload_uuid is already processed {str(upload_uuid)}')
+                    logger.info('Upload_uuid is already processed %s', upload_uuid)
+                    
+        return new_upload_uuid_list
+    
+    def get_uploaded_archives_to_process(
+        self
+    )-> List[AssasAstecArchive]:
+
+        registered_archive_list = []
+        
+        for upload_uuid in self.get_new_upload_uuids():
+            
+            archive_list = self.read_upload_info(upload_uuid)
+            registered_archive_list.extend(archive_list)
                     
         return registered_archive_list
     
     def process_uploads(
         self,       
     )-> bool:
-        
-        success = False
+        '''
+        Every upload is registered on its own. An upload which fails is logged and stays
+        unregistered, so it is picked up again by the next run without holding back the others.
+        '''
         
         try:
             
-            archive_list = self.get_uploaded_archives_to_process()
+            upload_uuid_list = self.get_new_upload_uuids()
+        
+        except (OSError, PyMongoError) as exception:
             
-            if len(archive_list) == 0:
-                logger.info('No new archives present')
-            else:
-                self.register_archives(archive_list)
+            logger.error('Error when looking for new uploads occured: %s', exception)
+            return False
+        
+        if len(upload_uuid_list) == 0:
+            logger.info('No new archives present')
+        
+        failures = 0
+        
+        for upload_uuid in upload_uuid_list:
             
-            success = True
-                   
-        except Exception as exception:
+            try:
+                
+                archive_list = self.read_upload_info(upload_uuid)
+                
+                if len(archive_list) == 0:
+                    logger.info('No archives present in upload %s', upload_uuid)
+                    continue
+                
+                self.register_archives(archive_list)
             
-            logger.error(f'Error when processing uploads occured: {exception}')
+            except (OSError, ValueError, KeyError, pickle.UnpicklingError, PyMongoError, concurrent.futures.BrokenExecutor) as exception:
                 
-        return success
+                failures += 1
+                logger.error('Error when processing upload %s occured: %s', upload_uuid, exception)
+                
+        return failures == 0
+    
+    def get_upload_directory(
+        self,
+        upload_uuid: uuid4
+    )-> str:
+        
+        return os.path.join(self.config.LSDF_ARCHIVE, str(upload_uuid))
+    
+    def get_upload_info_file(
+        self,
+        upload_uuid: uuid4
+    )-> str:
+        '''
+        Path of the JSON upload information. An upload_info.pickle written by the upload
+        is converted once into upload_info.json next to it. From then on upload_info.json
+        is the copy used by the database, the pickle is neither read nor updated again.
+        '''
+        
+        upload_directory = self.get_upload_directory(upload_uuid)
+        upload_info_file = os.path.join(upload_directory, 'upload_info.json')
+        
+        if not os.path.isfile(upload_info_file):
+            
+            pickle_file = os.path.join(upload_directory, 'upload_info.pickle')
+            logger.info('Convert %s into %s', pickle_file, upload_info_file)
+            
+            with open(pickle_file, 'rb') as file:
+                upload_info = pickle.load(file)
+            
+            _write_upload_info(upload_info_file, upload_info, reference_file=pickle_file)
+        
+        return upload_info_file
     
     def update_upload_info(
         self,
@@ -331,34 +617,39 @@ class AssasDatabaseManager:
         key: str,
         value_list: List[str]
     )-> bool:
+        '''
+        Only upload_info.json is updated, an upload_info.pickle of the upload keeps its former content.
+        '''
     
         success = False
         
         try:
             
             upload_info = {}
-            upload_info_file = self.config.LSDF_ARCHIVE + str(upload_uuid) + '/upload_info.pickle'
+            upload_info_file = self.get_upload_info_file(upload_uuid)
         
-            with open(upload_info_file, 'rb') as file:
-                upload_info = pickle.load(file)
+            upload_info = dict(_get_upload_info(upload_info_file))
             
-            logger.info(f'Upload information:')
-            for key, value in upload_info.items():
-                logger.info(f'{key}: {value}')
+            logger.info('Upload information:')
+            for info_key, info_value in upload_info.items():
+                logger.info('%s: %s', info_key, info_value)
             
-            logger.info(f'Update key {key} with value {value}')
+            logger.info('Update key %s with value %s', key, value_list)
             upload_info[key] = value_list
-        
-            with open(upload_info_file, 'wb+') as file:
-                pickle.dump(upload_info, file)
             
-            logger.info(f'Updated upload information:')
-            for key, value in upload_info.items():
-                logger.info(f'{key}: {value}')
+            _write_upload_info(upload_info_file, upload_info)
+            
+            _load_upload_info.cache_clear()
+            
+            logger.info('Updated upload information:')
+            for info_key, info_value in upload_info.items():
+                logger.info('%s: %s', info_key, info_value)
+            
+            success = True
             
         except Exception as exception:
             
-            logger.error(f'Error when updating upload information in file {upload_info_file} occured: {exception}')
+            logger.error('Error when updating upload information of upload %s occured: %s', upload_uuid, exception)
                 
         return success
     
@@ -369,24 +660,28 @@ class AssasDatabaseManager:
         
         archive_list = []
         
-        upload_info = {}
-        upload_directory = self.config.LSDF_ARCHIVE + str(upload_uuid) + '/upload_info.pickle'
-        
-        with open(upload_directory, 'rb') as file:
-            upload_info = pickle.load(file)
+        upload_info_file = self.get_upload_info_file(upload_uuid)
+        upload_info = _get_upload_info(upload_info_file)
         
-        date = datetime.now().strftime("%m/%d/%Y, %H:%M:%S")
+        date = datetime.now(timezone.utc)
         name = upload_info['name']
+        
+        upload_uuid_string = str(upload_uuid)
+        upload_directory = self.get_upload_directory(upload_uuid_string)
                 
         for idx, archive_path in enumerate(upload_info['archive_paths']):
+            
+            # archive paths are stored relative to the upload directory with a leading slash
+            archive_path = os.path.join(upload_directory, archive_path.lstrip('/'))
+            
             archive_list.append(AssasAstecArchive(
-                upload_uuid=str(upload_uuid),
+                upload_uuid=upload_uuid_string,
                 name=f'{name}_{idx}',
                 date=date,
                 user=upload_info['user'],
                 description=upload_info['description'],
-                archive_path=self.config.LSDF_ARCHIVE + str(upload_uuid) + archive_path,
-                result_path=self.config.LSDF_ARCHIVE + str(upload_uuid) + archive_path + '/../result/dataset.h5'
+                archive_path=archive_path,
+                result_path=os.path.normpath(os.path.join(archive_path, '..', 'result', 'dataset.h5'))
             ))
         
         return archive_list
@@ -401,28 +696,38 @@ class AssasDatabaseManager:
         archive_path_list = [archive.archive_path for archive in archive_list]      
         lists_of_saving_time = self.astec_handler.get_lists_of_saving_times(archive_path_list)
         
+        numbers_of_samples = [len(list_of_saving_time) for list_of_saving_time in lists_of_saving_time]
+        sizes_in_giga_bytes = numpy.round(AssasAstecHandler.get_sizes_of_archives_in_giga_bytes(numbers_of_samples), 2).tolist()
+        
+        document_list = []
+        
+        system_date = datetime.now(timezone.utc)
+        corrupted = AssasDocumentFileStatus.CORRUPTED
+        uploaded = AssasDocumentFileStatus.UPLOADED
+        
         for idx, archive in enumerate(archive_list):
+            
+            number_of_samples = numbers_of_samples[idx]
      
-            if len(lists_of_saving_time[idx]) == 1:
+            if number_of_samples == 1:
                 
-                system_status=AssasDocumentFileStatus.CORRUPTED
-                logger.error(f'Archive is corrupted, set status to CORRUPTED {archive.archive_path}')
+                system_status=corrupted
+                logger.error('Archive is corrupted, set status to CORRUPTED %s', archive.archive_path)
             
             else:
                 
-                logger.info(f'Archive is consistent, set status to UPLOADED {archive.archive_path}')
-                system_status=AssasDocumentFileStatus.UPLOADED
+                logger.info('Archive is consistent, set status to UPLOADED %s', archive.archive_path)
+                system_status=uploaded
                 
             document_file = AssasDocumentFile()
-            number_of_samples = len(lists_of_saving_time[idx])
             
             document_file.set_system_values(
-                system_uuid=str(uuid.uuid4()),
+                system_uuid=str(uuid4()),
                 system_upload_uuid=archive.upload_uuid,
-                system_date=datetime.now().strftime("%m/%d/%Y, %H:%M:%S"),
+                system_date=system_date,
                 system_path=archive.archive_path,
                 system_result=archive.result_path,
-                system_size=f'{str(round(AssasAstecHandler.get_size_of_archive_in_giga_bytes(number_of_samples), 2))} GB',
+                system_size=f'{str(sizes_in_giga_bytes[idx])} GB',
                 system_user=archive.user,
                 system_download='Download',
                 system_status=system_status
@@ -442,21 +747,29 @@ class AssasDatabaseManager:
                 meta_data_samples=dataset.get_no_samples()
             )
             
-            AssasHdf5DatasetHandler.write_meta_data_to_hdf5(
-                document=document_file
-            )
+            if system_status != corrupted:
+                
+                AssasHdf5DatasetHandler.write_meta_data_to_hdf5(
+                    document=document_file
+                )
+                
+                document_file.set_value('system_size_hdf5', AssasDatabaseManager.file_size(archive.result_path))
+            
+            else:
+                
+                document_file.set_value('system_size_hdf5', '0 B')
             
-            document_file.set_value('system_size_hdf5', AssasDatabaseManager.file_size(archive.result_path))
-            self.add_internal_database_entry(document_file.get_document())
+            document_list.append(document_file.get_document())
+        
+        self.add_internal_database_entries(document_list)
 
     def conversion_in_progress(
         self
     )-> bool:
         
-        documents = self.database_handler.get_file_documents_by_status(AssasDocumentFileStatus.CONVERTING)
-        document_files = [AssasDocumentFile(document) for document in documents]
+        documents = self.database_handler.get_file_documents_by_status(AssasDocumentFileStatus.CONVERTING, batch_size=1)
         
-        return len(document_files) > 0
+        return next(documents, None) is not None
     
     def convert_archives_to_hdf5(
         self,
@@ -478,20 +791,23 @@ class AssasDatabaseManager:
             return success
         
         if number_of_archives_to_convert >= 0:
-            logger.info(f'Update the first {number_of_archives_to_convert} archives in state VALIDATED')
+            logger.info('Update the first %s archives in state VALIDATED', number_of_archives_to_convert)
             document_file_list = document_files[0:number_of_archives_to_convert]
         else:
-            logger.info(f'Update all archives in state VALIDATED')
+            logger.info('Update all archives in state VALIDATED')
             document_file_list = document_files
         
         archive_path_list = [document_file.get_value('system_path') for document_file in document_file_list]
         result_path_list = [document_file.get_value('system_result') for document_file in document_file_list]
-        logger.info(f'Convert following archives: {archive_path_list}, result paths: {result_path_list}')
+        logger.info('Convert following archives: %s, result paths: %s', archive_path_list, result_path_list)
         
+        logger.info('Update status to CONVERTING')
         for document_file in document_file_list:
-            logger.info(f'Update status to CONVERTING')
             document_file.set_value('system_status', AssasDocumentFileStatus.CONVERTING)
-            self.database_handler.update_file_document_by_path(document_file.get_value('system_path'), document_file.get_document())      
+        
+        self.database_handler.update_file_documents_by_path({
+            document_file.get_value('system_path'): document_file.get_document() for document_file in document_file_list
+        })
         
         try:            
             
@@ -500,26 +816,30 @@ class AssasDatabaseManager:
                 result_path_list=result_path_list
             )
 
-            logger.info(f'Start writing result files ({result_path_list_returned}, {len(result_path_list_returned)})')
+            logger.info('Start writing result files (%s, %s)', result_path_list_returned, len(result_path_list_returned))
             
+            logger.info('Update status to CONVERTED')
             for idx, document_file in enumerate(document_file_list):
-
-                logger.info(f'Update status to CONVERTED')        
-                document_file.set_value('system_status', AssasDocumentFileStatus.CONVERTED)           
-                document_file.set_value('system_size_hdf5', AssasDatabaseManager.file_size(result_path_list[idx]))
                 
-                self.database_handler.update_file_document_by_path(archive_path_list[idx], document_file.get_document())
+                document_file.set_value('system_status', AssasDocumentFileStatus.CONVERTED)
+                document_file.set_value('system_size_hdf5', AssasDatabaseManager.file_size(result_path_list[idx]))
+            
+            self.database_handler.update_file_documents_by_path({
+                archive_path_list[idx]: document_file.get_document() for idx, document_file in enumerate(document_file_list)
+            })
             
             success = True
             
         except Exception as exception:
             
+            logger.info('Update status to FAILED')
             for document_file in document_file_list:
-                
-                logger.info(f'Update status to FAILED')
                 document_file.set_value('system_status', AssasDocumentFileStatus.FAILED)
-                self.database_handler.update_file_document_by_path(document_file.get_value('system_path'), document_file.get_document()) 
             
-            logger.error(f'Error during conversion occured: {exception}')
+            self.database_handler.update_file_documents_by_path({
+                document_file.get_value('system_path'): document_file.get_document() for document_file in document_file_list
+            })
+            
+            logger.error('Error during conversion occured: %s', exception)
 
         return success
@@ -6,14 +6,6 @@ from assasdb import AssasDatabaseManager
 
 logger = logging.getLogger('assas_app')
 
-logging.basicConfig(
-    format = '%(asctime)s %(process)d %(module)s %(levelname)s: %(message)s',
-    level = logging.INFO,
-    stream = sys.stdout)
-
-now = datetime.datetime.now()
-logger.info(f'Start update of archive sizes as cron job at {now}')
-
 class CronConfig(object):
     
     DEBUG = True
@@ -29,12 +21,22 @@ class CronConfig(object):
     ASTEC_PARSER = r'/root/assas-data-hub/assas_database/assasdb/assas_astec_parser.py'
     CONNECTIONSTRING = r'mongodb://localhost:27017/'
 
-config = CronConfig()
-
-manager = AssasDatabaseManager(config)
-
-manager.process_uploads()
-manager.update_archive_sizes()
-
-now = datetime.datetime.now()
-logger.info(f'Finished update of archives sizes at {now}')
\ No newline at end of file
+if __name__ == '__main__':
+    
+    logging.basicConfig(
+        format = '%(asctime)s %(process)d %(module)s %(levelname)s: %(message)s',
+        level = logging.INFO,
+        stream = sys.stdout)
+    
+    now = datetime.datetime.now()
+    logger.info(f'Start update of archive sizes as cron job at {now}')
+    
+    config = CronConfig()
+    
+    manager = AssasDatabaseManager(config)
+    
+    manager.process_uploads()
+    manager.update_archive_sizes()
+    
+    now = datetime.datetime.now()
+    logger.info(f'Finished update of archives sizes at {now}')
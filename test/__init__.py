@@ -1,3 +1,4 @@
 from .test_database_manager import AssasDatabaseManagerTest
 from .test_astec_handler import AssasAstecHandlerTest
-from .test_database_handler import AssasDatabaseHandlerTest
\ No newline at end of file
+from .test_database_handler import AssasDatabaseHandlerTest
+from .test_database_hdf5 import AssasHdf5DatasetHandlerTest
\ No newline at end of file
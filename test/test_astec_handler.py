@@ -6,6 +6,8 @@ from typing import List, Tuple, Union
 
 from assasdb import AssasAstecHandler, AssasAstecArchive
 
+from ._fixtures import TestConfig
+
 logger = logging.getLogger('assas_test')
 
 logging.basicConfig(
@@ -13,6 +15,10 @@ logging.basicConfig(
     level = logging.INFO,
     stream = sys.stdout)
 
+_SBO_FB_SAMPLE_DIRECTORY = '/mnt/ASSAS/upload_horeka/results/24b15f81-d4fd-4605-b324-0f85ab07917f/all_samples/sample_%d'
+_SBO_FB_ARCHIVE_PATH = _SBO_FB_SAMPLE_DIRECTORY + '/STUDY/TRANSIENT/BASE_SIMPLIFIED/SBO/SBO_feedbleed/SBO_fb_1300_LIKE_SIMPLIFIED_ASSAS.bin'
+_SBO_FB_RESULT_PATH = _SBO_FB_SAMPLE_DIRECTORY + '/result/dataset.h5'
+
 class SBO_fb_100_samples:
     
     def __init__(
@@ -20,7 +26,7 @@ class SBO_fb_100_samples:
         number_of_samples: int = 100
     ) -> None:
         
-        self._archive_list = [SBO_fb_100_samples.archive_factory(sample) for sample in range(1, number_of_samples + 1)]
+        self._archive_list = list(map(SBO_fb_100_samples.archive_factory, range(1, number_of_samples + 1)))
         
     def get_archive_list(
         self
@@ -39,33 +45,22 @@ class SBO_fb_100_samples:
             '08/05/2024, 23:25:37',
             'Anastasia Stakhanova',
             f'Station blackout scenario number, with 2 parameters {number}',
-            f'/mnt/ASSAS/upload_horeka/results/24b15f81-d4fd-4605-b324-0f85ab07917f/all_samples/sample_{number}/STUDY/TRANSIENT/BASE_SIMPLIFIED/SBO/SBO_feedbleed/SBO_fb_1300_LIKE_SIMPLIFIED_ASSAS.bin',
-            f'/mnt/ASSAS/upload_horeka/results/24b15f81-d4fd-4605-b324-0f85ab07917f/all_samples/sample_{number}/result/dataset.h5'
+            _SBO_FB_ARCHIVE_PATH % number,
+            _SBO_FB_RESULT_PATH % number
         )
 
-class TestConfig(object):
-    
-    DEBUG = True
-    DEVELOPMENT = True
-    LSDF_ARCHIVE = r'/mnt/ASSAS/upload_test/'
-    LOCAL_ARCHIVE = r'/root/upload/'
-    PYTHON_VERSION = r'/opt/python/3.11.8/bin/python3.11'
-    ASTEC_ROOT = r'/root/astecV3.1.1_linux64/astecV3.1.1'
-    ASTEC_COMPUTER = r'linux_64'
-    ASTEC_COMPILER = r'release' 
-    ASTEC_PARSER = r'/root/assas-data-hub/assas_database/assasdb/assas_astec_parser.py'
-    CONNECTIONSTRING = r'mongodb://localhost:27017/'
-
 class AssasAstecHandlerTest(unittest.TestCase):
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         
-        self.config = TestConfig()
-        self.astec_handler = AssasAstecHandler(self.config)        
+        cls.config = TestConfig()
+        cls.astec_handler = AssasAstecHandler(cls.config)
         
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         
-        self.astec_handler = None
+        cls.astec_handler = None
         
 #    def test_astec_handler_read_binaries(self):
 #        
@@ -89,6 +84,14 @@ class AssasAstecHandlerTest(unittest.TestCase):
         
         size_in_giga_bytes = AssasAstecHandler.get_size_of_archive_in_giga_bytes(69941)        
         self.assertEqual(size_in_giga_bytes, 117.50088)
+        
+    def test_astec_handler_get_sizes_of_archives_in_giga_bytes(self):
+        
+        numbers_of_timesteps = [1, 15927, 69941]
+        sizes_in_giga_bytes = AssasAstecHandler.get_sizes_of_archives_in_giga_bytes(numbers_of_timesteps)
+        
+        for number_of_timesteps, size_in_giga_bytes in zip(numbers_of_timesteps, sizes_in_giga_bytes):
+            self.assertAlmostEqual(size_in_giga_bytes, AssasAstecHandler.get_size_of_archive_in_giga_bytes(number_of_timesteps))
 
 if __name__ == '__main__':
     unittest.main()        
\ No newline at end of file
@@ -8,33 +8,26 @@ from uuid import uuid4
 from assasdb import AssasDatabaseHandler
 from assasdb import AssasDocumentFile
 
-logger = logging.getLogger('assas_app')
+from ._fixtures import TestConfig
 
-class TestConfig(object):
-    
-    DEBUG = True
-    DEVELOPMENT = True
-    LSDF_ARCHIVE = r'/mnt/ASSAS/upload_test/'
-    LOCAL_ARCHIVE = r'/root/upload/'
-    PYTHON_VERSION = r'/opt/python/3.11.8/bin/python3.11'
-    ASTEC_ROOT = r'/root/astecV3.1.1_linux64/astecV3.1.1'
-    ASTEC_COMPUTER = r'linux_64'
-    ASTEC_COMPILER = r'release' 
-    ASTEC_PARSER = r'/root/assas-data-hub/assas_database/assasdb/assas_astec_parser.py'
-    CONNECTIONSTRING = r'mongodb://localhost:27017/'
+logger = logging.getLogger('assas_app')
 
 class AssasDatabaseHandlerTest(unittest.TestCase):
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         
         config = TestConfig()
-        self.database_handler = AssasDatabaseHandler(config)
+        cls.database_handler = AssasDatabaseHandler(config)
         
-        self.database_handler.drop_file_collection()
+    @classmethod
+    def tearDownClass(cls):
         
-    def tearDown(self):
+        cls.database_handler = None
+    
+    def setUp(self):
         
-        self.database_handler = None
+        self.database_handler.drop_file_collection()
 
     def test_database_handler_insert_and_find(self):
         
@@ -58,6 +51,16 @@ class AssasDatabaseHandlerTest(unittest.TestCase):
                 
         self.assertEqual(document, found_document)
         
+    def test_database_handler_insert_many_and_find(self):
+        
+        documents = [AssasDocumentFile.get_test_document_file(system_path=f'path_{idx}') for idx in range(3)]
+        
+        self.database_handler.insert_file_documents(documents)
+        
+        for document in documents:
+            found_document = self.database_handler.get_file_document_by_uuid(document['system_uuid'])
+            self.assertEqual(document, found_document)
+        
     def test_database_handler_insert_update_and_find(self):
         
         document = AssasDocumentFile.get_test_document_file()
@@ -75,6 +78,18 @@ class AssasDatabaseHandlerTest(unittest.TestCase):
                 
         self.assertEqual(update['system_result'], found_document['system_result'])
         
+    def test_database_handler_insert_and_set_status(self):
+        
+        document = AssasDocumentFile.get_test_document_file()
+        uuid = document['system_uuid']
+        
+        self.database_handler.insert_file_document(document)
+        
+        updated_document = self.database_handler.set_status_by_uuid(uuid, 'Validated')
+        
+        self.assertEqual(updated_document['system_status'], 'Validated')
+        self.assertIn('system_last_modified', updated_document)
+        
     def test_database_handler_insert_update_by_path_and_find(self):
         
         document = AssasDocumentFile.get_test_document_file()
@@ -92,24 +107,79 @@ class AssasDatabaseHandlerTest(unittest.TestCase):
                 
         self.assertEqual(update['system_result'], found_document['system_result'])
         
+    def test_database_handler_insert_many_update_by_path_and_find(self):
+        
+        documents = [AssasDocumentFile.get_test_document_file(system_path=f'path_{idx}') for idx in range(3)]
+        updates = {document['system_path']: {'system_size': f'{idx} GB'} for idx, document in enumerate(documents)}
+        
+        self.database_handler.insert_file_documents(documents)
+        self.database_handler.update_file_documents_by_path(updates)
+        
+        for path, update in updates.items():
+            found_document = self.database_handler.get_file_document_by_path(path)
+            self.assertEqual(update['system_size'], found_document['system_size'])
+        
     def test_database_handler_insert_update_by_upload_uuid_and_find(self):
         
         new_upload_uuid = uuid4()
-        document = AssasDocumentFile.get_test_document_file(system_upload_uuid=str(new_upload_uuid))
-        print(document)
+        upload_uuid_string = str(new_upload_uuid)
+        document = AssasDocumentFile.get_test_document_file(system_upload_uuid=upload_uuid_string)
         update = {'system_user':'usertochange'}
         
         self.database_handler.insert_file_document(document)
         
-        found_document = self.database_handler.get_file_document_by_upload_uuid(new_upload_uuid)
+        found_document = self.database_handler.get_file_document_by_upload_uuid(upload_uuid_string)
         self.assertEqual(document, found_document)        
         
-        self.database_handler.update_file_document_by_upload_uuid(new_upload_uuid, update)
+        self.database_handler.update_file_document_by_upload_uuid(upload_uuid_string, update)
         
-        found_document = self.database_handler.get_file_document_by_upload_uuid(new_upload_uuid)
+        found_document = self.database_handler.get_file_document_by_upload_uuid(upload_uuid_string)
                 
         self.assertEqual(update['system_user'], found_document['system_user'])
         
+    def test_database_handler_get_known_upload_uuids(self):
+        
+        document = AssasDocumentFile.get_test_document_file()
+        upload_uuid = document['system_upload_uuid']
+        unknown_upload_uuid = uuid4()
+        
+        self.database_handler.insert_file_document(document)
+        
+        known_upload_uuids = self.database_handler.get_known_upload_uuids([uuid.UUID(upload_uuid), unknown_upload_uuid])
+        
+        self.assertEqual(known_upload_uuids, {upload_uuid})
+        
+    def test_database_handler_get_file_documents_by_upload_uuids(self):
+        
+        documents = [AssasDocumentFile.get_test_document_file(system_path=f'path_{idx}') for idx in range(3)]
+        unknown_upload_uuid = uuid4()
+        
+        self.database_handler.insert_file_documents(documents)
+        
+        upload_uuid_list = [uuid.UUID(document['system_upload_uuid']) for document in documents]
+        found_documents = self.database_handler.get_file_documents_by_upload_uuids(upload_uuid_list + [unknown_upload_uuid])
+        
+        self.assertEqual(len(found_documents), len(documents))
+        for document in documents:
+            self.assertEqual(document, found_documents[document['system_upload_uuid']])
+        
+    def test_database_handler_version_shared_between_handlers(self):
+        
+        other_database_handler = AssasDatabaseHandler(TestConfig())
+        version = self.database_handler.get_version()
+        
+        other_database_handler.insert_file_document(AssasDocumentFile.get_test_document_file())
+        
+        self.assertGreater(self.database_handler.get_version(), version)
+        
+    def test_database_handler_file_indexes(self):
+        
+        index_information = self.database_handler.get_file_collection().index_information()
+        
+        self.assertTrue(index_information['system_uuid_1']['unique'])
+        self.assertTrue(index_information['system_path_1']['unique'])
+        self.assertEqual(index_information['system_upload_uuid_1']['key'], [('system_upload_uuid', 1)])
+        
     def test_database_handler_empty_database(self):
         
         self.database_handler.drop_file_collection()
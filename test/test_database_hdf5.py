@@ -0,0 +1,94 @@
+import unittest
+import logging
+import os
+import tempfile
+import h5py
+import numpy as np
+
+from assasdb import AssasDataset, AssasHdf5DatasetHandler, AssasDocumentFile
+
+logger = logging.getLogger('assas_test')
+
+class AssasHdf5DatasetHandlerTest(unittest.TestCase):
+    
+    def setUp(self):
+        
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, 'dataset.h5')
+        
+        self.dataset = AssasDataset('SBO fb', 10)
+        self.dataset.get_all_data()[:] = np.arange(self.dataset.get_all_data().size).reshape(self.dataset.get_all_data().shape)
+        
+    def tearDown(self):
+        
+        self.directory.cleanup()
+        
+    def test_hdf5_write_and_read_data(self):
+        
+        AssasHdf5DatasetHandler.write_data_into_hdf5(self.file_path, self.dataset)
+        
+        for variable in self.dataset.get_variables():
+            array = AssasHdf5DatasetHandler.get_variable_data_from_hdf5(self.file_path, variable)
+            np.testing.assert_array_equal(array, self.dataset.get_data_for_variable(variable))
+        
+        self.assertIsNone(AssasHdf5DatasetHandler.get_variable_data_from_hdf5(self.file_path, 'unknown'))
+        
+    def test_hdf5_write_and_read_data_without_samples(self):
+        
+        dataset = AssasDataset('SBO fb', 0)
+        
+        AssasHdf5DatasetHandler.write_data_into_hdf5(self.file_path, dataset)
+        
+        for variable in dataset.get_variables():
+            array = AssasHdf5DatasetHandler.get_variable_data_from_hdf5(self.file_path, variable)
+            self.assertEqual(np.shape(array), (dataset.get_no_channels(), dataset.get_no_meshes(), 0))
+        
+    def test_hdf5_read_data_of_legacy_layout(self):
+        
+        with h5py.File(self.file_path, 'w') as h5file:
+            
+            data_group = h5file.create_group('data')
+            
+            for variable in self.dataset.get_variables():
+                data_group.create_group(variable).create_dataset(variable, data=self.dataset.get_data_for_variable(variable))
+        
+        for variable in self.dataset.get_variables():
+            array = AssasHdf5DatasetHandler.get_variable_data_from_hdf5(self.file_path, variable)
+            np.testing.assert_array_equal(array, self.dataset.get_data_for_variable(variable))
+        
+    def test_hdf5_write_and_read_meta_data(self):
+        
+        document = AssasDocumentFile.get_test_document_file(system_result=self.file_path)
+        
+        AssasHdf5DatasetHandler.write_meta_data_to_hdf5(AssasDocumentFile(document))
+        
+        read_document = AssasHdf5DatasetHandler.read_meta_data_from_hdf5(AssasDocumentFile({'system_result': self.file_path}))
+        
+        for key in ['meta_name', 'meta_description', 'meta_data_variables', 'meta_data_channels', 'meta_data_meshes', 'meta_data_samples']:
+            self.assertEqual(read_document.get_value(key), document[key])
+        
+    def test_hdf5_read_meta_data_of_legacy_attributes(self):
+        
+        with h5py.File(self.file_path, 'w') as h5file:
+            
+            meta_data_group = h5file.create_group('meta_data')
+            
+            meta_data_group.attrs['uuid'] = 'legacy_uuid'
+            meta_data_group.attrs['name'] = 'SBO fb'
+            meta_data_group.attrs['description'] = 'Station blackout scenario'
+            meta_data_group.attrs['variables'] = '[pressure voidf temp sat_temp]'
+            meta_data_group.attrs['channels'] = 4
+            meta_data_group.attrs['meshes'] = 16
+            meta_data_group.attrs['samples'] = 10
+        
+        read_document = AssasHdf5DatasetHandler.read_meta_data_from_hdf5(AssasDocumentFile({'system_result': self.file_path}))
+        
+        self.assertEqual(read_document.get_value('meta_name'), 'SBO fb')
+        self.assertEqual(read_document.get_value('meta_description'), 'Station blackout scenario')
+        self.assertEqual(read_document.get_value('meta_data_variables'), '[pressure voidf temp sat_temp]')
+        self.assertEqual(read_document.get_value('meta_data_channels'), '4')
+        self.assertEqual(read_document.get_value('meta_data_meshes'), '16')
+        self.assertEqual(read_document.get_value('meta_data_samples'), '10')
+        
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,8 @@ import shutil
 import sys
 import uuid
 import pickle 
+import json
+import tempfile
 
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -12,6 +14,9 @@ from uuid import uuid4
 from typing import List, Tuple, Union
 
 from assasdb import AssasDatabaseManager, AssasAstecArchive, AssasDocumentFileStatus
+from assasdb.assas_database_manager import _write_upload_info
+
+from ._fixtures import TestConfig
 
 logger = logging.getLogger('assas_test')
 
@@ -20,6 +25,9 @@ logging.basicConfig(
     level = logging.DEBUG,
     stream = sys.stdout)
 
+_SBO_FB_ARCHIVE_PATH = '/mnt/ASSAS/upload_test/%s/STUDY/TRANSIENT/BASE_SIMPLIFIED/SBO/SBO_feedbleed/SBO_fb_1300_LIKE_SIMPLIFIED_ASSAS.bin'
+_SBO_FB_RESULT_PATH = '/mnt/ASSAS/upload_test/%s/result/dataset.h5'
+
 class SBO_fb_test_samples:
     
     def __init__(
@@ -29,7 +37,7 @@ class SBO_fb_test_samples:
         
         self._config = config
         self._upload_uuids = [uuid.UUID('2bdd775d-442c-487f-a0a0-9aec7f47d796'),uuid.UUID('ce3b0594-c213-4339-a334-f4a099b17da9')]
-        self._archive_list = [SBO_fb_test_samples.archive_factory(upload_uuid) for upload_uuid in self._upload_uuids]
+        self._archive_list = list(map(SBO_fb_test_samples.archive_factory, self._upload_uuids))
         
     def get_archive_list(
         self
@@ -42,41 +50,30 @@ class SBO_fb_test_samples:
         upload_uuid: uuid4
     )-> AssasAstecArchive:
         
+        upload_uuid_string = str(upload_uuid)
+        
         return AssasAstecArchive(
-            upload_uuid=f'{str(upload_uuid)}',
+            upload_uuid=upload_uuid_string,
             name='SBO fb',
-            date='08/05/2024, 23:25:37',
+            date=datetime(2024, 8, 5, 23, 25, 37),
             user='ke4920',
             description=f'Station blackout scenario number, with 2 parameters',
-            archive_path=f'/mnt/ASSAS/upload_test/{str(upload_uuid)}/STUDY/TRANSIENT/BASE_SIMPLIFIED/SBO/SBO_feedbleed/SBO_fb_1300_LIKE_SIMPLIFIED_ASSAS.bin',
-            result_path=f'/mnt/ASSAS/upload_test/{str(upload_uuid)}/result/dataset.h5'
+            archive_path=_SBO_FB_ARCHIVE_PATH % upload_uuid_string,
+            result_path=_SBO_FB_RESULT_PATH % upload_uuid_string
         )
     
-class TestConfig(object):
-    
-    DEBUG = True
-    DEVELOPMENT = True
-    LSDF_ARCHIVE = r'/mnt/ASSAS/upload_test/'
-    UPLOAD_DIRECTORY = r'/mnt/ASSAS/upload_test/uploads/'
-    UPLOAD_FILE = r'/mnt/ASSAS/upload_test/uploads/uploads.txt'
-    LOCAL_ARCHIVE = r'/root/upload/'
-    PYTHON_VERSION = r'/opt/python/3.11.8/bin/python3.11'
-    ASTEC_ROOT = r'/root/astecV3.1.1_linux64/astecV3.1.1'
-    ASTEC_COMPUTER = r'linux_64'
-    ASTEC_COMPILER = r'release' 
-    ASTEC_PARSER = r'/root/assas-data-hub/assas_database/assasdb/assas_astec_parser.py'
-    CONNECTIONSTRING = r'mongodb://localhost:27017/'
-
 class AssasDatabaseManagerTest(unittest.TestCase):
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         
-        self.config = TestConfig()
-        self.database_manager = AssasDatabaseManager(self.config)
+        cls.config = TestConfig()
+        cls.database_manager = AssasDatabaseManager(cls.config)
         
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         
-        self.database_manager = None
+        cls.database_manager = None
 
     def test_database_manager_empty(self):
 
@@ -123,6 +120,52 @@ class AssasDatabaseManagerTest(unittest.TestCase):
         size = AssasDatabaseManager.convert_from_bytes(size_bytes)
         print(f'size {size}')
         
+    def test_database_manager_convert_from_bytes(self):
+        
+        self.assertEqual(AssasDatabaseManager.convert_from_bytes(512), '512 B')
+        self.assertEqual(AssasDatabaseManager.convert_from_bytes(1024.0), '1.0 KB')
+        self.assertEqual(AssasDatabaseManager.convert_from_bytes(8.4 * 1024 ** 2), '8.4 MB')
+        self.assertEqual(AssasDatabaseManager.convert_from_bytes(1024.0 ** 4), '1.0 TB')
+        
+    def test_database_manager_get_size_of_nested_directory(self):
+        
+        with tempfile.TemporaryDirectory() as directory:
+            
+            os.makedirs(os.path.join(directory, 'a', 'b'))
+            
+            for path, size in [('file', 10), ('a/file', 100), ('a/b/file', 1000)]:
+                with open(os.path.join(directory, path), 'wb') as file:
+                    file.write(b'0' * size)
+            
+            os.symlink(os.path.join(directory, 'a'), os.path.join(directory, 'link'))
+            
+            size_bytes = AssasDatabaseManager.get_size_of_directory_in_bytes(directory)
+            
+            self.assertEqual(size_bytes, 1110 + os.lstat(os.path.join(directory, 'link')).st_size)
+            self.assertEqual(AssasDatabaseManager.get_size_of_directory_in_bytes(os.path.join(directory, 'file')), 10)
+        
+    def test_database_manager_write_upload_info(self):
+        
+        upload_uuid = uuid4()
+        upload_info = {'name': 'SBO fb', 'date': datetime(2024, 8, 5, 23, 25, 37), 'upload_uuid': upload_uuid}
+        
+        with tempfile.TemporaryDirectory() as directory:
+            
+            upload_info_file = os.path.join(directory, 'upload_info.json')
+            _write_upload_info(upload_info_file, upload_info)
+            
+            with open(upload_info_file, 'r') as file:
+                self.assertEqual(json.load(file), {'name': 'SBO fb', 'date': '2024-08-05T23:25:37', 'upload_uuid': str(upload_uuid)})
+            
+            os.chmod(upload_info_file, 0o644)
+            _write_upload_info(upload_info_file, upload_info)
+            self.assertEqual(os.stat(upload_info_file).st_mode & 0o777, 0o644)
+            
+            with self.assertRaises(ValueError):
+                _write_upload_info(os.path.join(directory, 'invalid.json'), {'name': 'SBO fb', 'value': object()})
+            
+            self.assertEqual(os.listdir(directory), ['upload_info.json'])
+        
     def test_database_manager_file_size(self):
         
         size = AssasDatabaseManager.file_size('/mnt/ASSAS/upload_test/0c65e12b-a75b-486b-b3ff-cc68fc89b78a/result/dataset.h5')